@@ -4,12 +4,21 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import pandas as pd
-import json
+from selenium.common.exceptions import TimeoutException
+import asyncio
+import atexit
+import functools
+import shutil
+import tempfile
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+import operator
+import queue
+import random
 import re
 import os
 from pathlib import Path
@@ -18,50 +27,201 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import requests
-from bs4 import BeautifulSoup
-import matplotlib.pyplot as plt
+import httpx
+
+# pandas, matplotlib and bs4 are imported lazily inside the code that uses
+# them: together they add ~1s to interpreter startup, which dominates short
+# API-only invocations
+
+# orjson decodes the API payloads a few times faster than the stdlib and
+# works straight from bytes; fall back to each response's own .json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_json_response(response):
+    """Decode an HTTP response body to Python objects.
+
+    Uses orjson on the raw bytes when available, skipping the text decode
+    that response.json() performs first.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Price cleaning runs for every scraped row, so the stripping machinery is
+# built once at import: a translation table for the common ASCII case and a
+# precompiled regex fallback for non-ASCII currency symbols
+_PRICE_RE = re.compile(r'[^\d.]+')
+_PRICE_STRIP_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) == '.')
+))
+
+
+def _timestamped_path(directory: Path, prefix: str, suffix: str) -> Path:
+    """Build a timestamped file path.
+
+    f-string datetime formatting skips the strftime dispatch and keeps the
+    naming scheme in one place.
+    """
+    return directory / f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}{suffix}"
+
+
+# Cached ISO timestamp: formatting is locale-aware and surprisingly costly,
+# and rows produced in the same half-second can share one formatted string
+_last_iso = [0.0, ""]
+
+
+def _fast_iso_now() -> str:
+    """Return the current time in ISO format, cached for up to 0.5s."""
+    t = time.time()
+    if t - _last_iso[0] > 0.5:
+        _last_iso[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _last_iso[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dirs(base: str) -> Dict[str, Path]:
+    """Create the data directory tree once per base path.
+
+    The cache keys on the base path, so repeated object construction skips
+    the mkdir syscalls after the first call.
+    """
+    base_path = Path(base)
+    base_path.mkdir(exist_ok=True)
+
+    dirs = {
+        'base': base_path,
+        'logs': base_path / 'logs',
+        'screenshots': base_path / 'screenshots'
+    }
+    dirs['logs'].mkdir(exist_ok=True)
+    dirs['screenshots'].mkdir(exist_ok=True)
+    return dirs
+
+
+def _configure_logger(name: str, *handlers: logging.Handler) -> logging.Logger:
+    """Attach handlers to a named logger exactly once.
+
+    logging.basicConfig is a global no-op after its first call, so the
+    second class to configure logging through it silently lost its
+    handlers; configuring named loggers directly sidesteps that.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.setLevel(logging.INFO)
+        for handler in handlers:
+            logger.addHandler(handler)
+        logger.propagate = False
+    return logger
 
 
 class BybitScraper:
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    # Shared pool of warm Chrome drivers so repeated scrapes reuse an
+    # existing browser process instead of paying Chrome startup every time
+    _driver_pool: queue.Queue = queue.Queue()
+
+    # Locator tuples built once instead of re-allocated on every call
+    _SEL_TBODY = (By.TAG_NAME, "tbody")
+    _SEL_PRICE_CELLS = (By.CSS_SELECTOR, "tbody tr td:nth-child(2)")
+
+    # Successful results are served from memory for this many seconds so
+    # tight polling loops don't re-drive Chrome for identical queries
+    _cache_ttl = 30
+
+    # Listener thread behind the shared 'BybitScraper' logger; started by
+    # the first instance and stopped once at interpreter exit
+    _log_listener = None
+
+    # Chrome holds a singleton lock on its user-data-dir, so every launched
+    # driver gets its own temp profile; the mapping lets us delete the dir
+    # when its driver is finally quit instead of leaking one per launch
+    _driver_profiles: Dict = {}
+
+    def __init__(self, headless: bool = True, timeout: int = 30, debug: bool = False):
         """Initialize the Bybit P2P scraper."""
         self.timeout = timeout
+        self.debug = debug
+        self._cache: Dict[tuple, tuple] = {}
+        # Screenshot writes go through this pool so PNG disk I/O never
+        # blocks the scrape loop
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scraper-io')
         self._setup_directories()
         self._setup_logging()
-        self.driver = self._initialize_driver(headless)
+        self.driver = self._acquire_driver(headless)
+
+    def _acquire_driver(self, headless: bool) -> webdriver.Chrome:
+        """Check a driver out of the shared pool, launching one if none is free."""
+        try:
+            driver = self._driver_pool.get_nowait()
+            self.logger.info("Reusing pooled Chrome driver")
+            return driver
+        except queue.Empty:
+            return self._initialize_driver(headless)
+
+    @classmethod
+    def _quit_driver(cls, driver) -> None:
+        """Quit a driver and delete the temp profile dir it was launched with."""
+        try:
+            driver.quit()
+        finally:
+            profile_dir = cls._driver_profiles.pop(driver, None)
+            if profile_dir is not None:
+                shutil.rmtree(profile_dir, ignore_errors=True)
 
     def _setup_directories(self):
         """Set up necessary directories for storing data and logs."""
-        # Create base directory for all data
-        self.data_dir = Path('pb2b')
-        self.data_dir.mkdir(exist_ok=True)
-        
-        # Create subdirectories for different types of data
-        self.logs_dir = self.data_dir / 'logs'
-        self.screenshots_dir = self.data_dir / 'screenshots'
-        
-        for directory in [self.logs_dir, self.screenshots_dir]:
-            directory.mkdir(exist_ok=True)
+        dirs = _ensure_dirs('pb2b')
+        self.data_dir = dirs['base']
+        self.logs_dir = dirs['logs']
+        self.screenshots_dir = dirs['screenshots']
 
     def _setup_logging(self):
         """Set up logging configuration."""
-        log_file = self.logs_dir / f'bybit_scraper_{datetime.now().strftime("%Y%m%d")}.log'
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        log_file = self.logs_dir / f'bybit_scraper_{datetime.now():%Y%m%d}.log'
+
+        if not logging.getLogger('BybitScraper').handlers:
+            # The scrape loop only appends records to an in-memory queue; a
+            # background listener thread does the actual file/stream writes so
+            # logging never blocks on disk I/O
+            formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            # delay=True defers opening the file until the first record arrives
+            file_handler = logging.FileHandler(log_file, delay=True)
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            _configure_logger('BybitScraper', QueueHandler(log_queue))
+            BybitScraper._log_listener = QueueListener(
+                log_queue, file_handler, stream_handler, respect_handler_level=True
+            )
+            BybitScraper._log_listener.start()
+            atexit.register(BybitScraper._stop_log_listener)
+
+        self.logger = logging.getLogger('BybitScraper')
         self.logger.info(f"Logging initialized. Log file: {log_file}")
 
+    @classmethod
+    def _stop_log_listener(cls):
+        """Flush queued records and stop the listener thread (idempotent)."""
+        listener = cls._log_listener
+        if listener is not None:
+            cls._log_listener = None
+            listener.stop()
+
     def _initialize_driver(self, headless: bool) -> webdriver.Chrome:
         """Initialize and configure the Chrome WebDriver."""
         chrome_options = Options()
+        # Return from driver.get as soon as the DOM is interactive; the
+        # explicit waits on the table guarantee readiness before reading it
+        chrome_options.page_load_strategy = 'eager'
         if headless:
             chrome_options.add_argument('--headless=new')
 
@@ -72,40 +232,97 @@ class BybitScraper:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # The scraper only reads table text, so skip downloading images,
+        # fonts and stylesheets entirely, and block the interactive
+        # subsystems the page might try to use (2 = block)
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.popups": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        # Belt and braces: renderer-level image disabling as well
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        # Subsystems a headless scraper never needs; each one saves startup
+        # work and background network chatter
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-translate')
+        chrome_options.add_argument('--disable-default-apps')
+        chrome_options.add_argument('--no-first-run')
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                                   "AppleWebKit/537.36 (KHTML, like Gecko) "
                                   "Chrome/120.0.0.0 Safari/537.36")
 
+        # Give the driver a private profile with a real disk cache (100MB
+        # cap) so repeated scrapes through the pool hit Chrome's cache
+        # instead of re-downloading JS/CSS every time; it lives in a temp
+        # dir and is deleted when the driver is quit, so the data directory
+        # never accumulates profiles across cron runs
+        profile_dir = Path(tempfile.mkdtemp(prefix='bybit_chrome_profile_'))
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        chrome_options.add_argument(f'--disk-cache-dir={profile_dir / "cache"}')
+        chrome_options.add_argument('--disk-cache-size=104857600')
+
         service = Service()
-        return webdriver.Chrome(service=service, options=chrome_options)
+        try:
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+        self._driver_profiles[driver] = profile_dir
+
+        # Block trackers and heavy static assets at the network layer so the
+        # requests are never issued; none of them feed the listings table
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+                "*facebook.net*", "*intercom*", "*hotjar*", "*sentry.io*",
+                "*.png", "*.jpg", "*.webp", "*.svg", "*.woff*"
+            ]})
+        except Exception as e:
+            self.logger.warning(f"Could not install CDP URL blocklist: {str(e)}")
+
+        return driver
 
     def _clean_price(self, price_text: str) -> Optional[float]:
         """Clean and convert price text to float."""
-        try:
-            if not price_text or price_text.isspace():
-                return None
+        if not price_text or price_text.isspace():
+            return None
 
-            price_str = re.sub(r'[^\d.]', '', price_text.split('\n')[0])
-            return float(price_str) if price_str else None
-        except Exception as e:
-            self.logger.warning(f"Error cleaning price {price_text}: {str(e)}")
+        price_str = price_text.split('\n', 1)[0].translate(_PRICE_STRIP_TABLE)
+        if not price_str or price_str == '.':
             return None
 
-    def _extract_additional_info(self, row) -> Dict:
-        """Extract additional information from the row."""
         try:
-            available_amount = row.find_element(By.CSS_SELECTOR, "td:nth-child(3)").text.strip()
-            payment_methods = row.find_element(By.CSS_SELECTOR, "td:nth-child(4)").text.strip()
-            merchant_name = row.find_element(By.CSS_SELECTOR, "td:nth-child(5)").text.strip()
+            return float(price_str)
+        except ValueError:
+            # Non-ASCII currency symbols survive the ASCII table; strip
+            # them with the regex before giving up
+            price_str = _PRICE_RE.sub('', price_str)
+            try:
+                return float(price_str) if price_str else None
+            except ValueError as e:
+                # Lazy %s formatting: the message is only built if the
+                # warning level is actually enabled
+                self.logger.warning("Error cleaning price %r: %s", price_text, e)
+                return None
 
-            return {
-                "available_amount": available_amount,
-                "payment_methods": payment_methods,
-                "merchant_name": merchant_name
-            }
-        except NoSuchElementException as e:
-            self.logger.warning(f"Could not extract additional info: {str(e)}")
-            return {}
+    def _extract_table(self) -> List[List[str]]:
+        """Serialize the listings table out of the browser in one JS call.
+
+        Running the selector once in the browser and returning the whole
+        table avoids re-querying each row's subtree through ChromeDriver.
+        """
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll('tbody tr'), "
+            "tr => Array.from(tr.cells, c => c.innerText));"
+        )
 
     def get_p2p_listings(
         self,
@@ -115,6 +332,12 @@ class BybitScraper:
         max_retries: int = 10
     ) -> Dict[str, Union[bool, List[Dict], str]]:
         """Scrape P2P listings from Bybit website."""
+        cache_key = (token, fiat, action_type)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            self.logger.info(f"Returning cached listings for {token}/{fiat}")
+            return cached[1]
+
         url = f"https://www.bybit.com/fiat/trade/otc?actionType={action_type}&token={token}&fiat={fiat}"
 
         for attempt in range(max_retries):
@@ -123,61 +346,100 @@ class BybitScraper:
                 self.driver.get(url)
 
                 WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "tbody"))
+                    EC.presence_of_element_located(self._SEL_TBODY)
                 )
 
-                time.sleep(5)
-
-                # Take screenshot with organized path
-                screenshot_path = self.screenshots_dir / f"bybit_page_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.driver.save_screenshot(str(screenshot_path))
-                self.logger.info(f"Screenshot saved as '{screenshot_path}'")
+                # Wait until the price cells are actually populated instead of
+                # sleeping a fixed 5 seconds for dynamic content
+                def _price_cells_ready(d):
+                    cells = d.find_elements(*self._SEL_PRICE_CELLS)
+                    return bool(cells) and all(c.text.strip() for c in cells[:3])
+
+                try:
+                    WebDriverWait(self.driver, self.timeout).until(_price_cells_ready)
+                except TimeoutException:
+                    # Cells never reported ready; give the page one short
+                    # grace period rather than failing the whole attempt
+                    time.sleep(1)
+
+                # Screenshots are debug telemetry only; skip the PNG encode
+                # and disk write on production scrapes
+                if self.debug:
+                    screenshot_path = _timestamped_path(self.screenshots_dir, "bybit_page", ".png")
+                    # Fetch the PNG bytes over CDP and hand the disk write to
+                    # the I/O pool so the scrape loop never waits on fsync
+                    png_bytes = self.driver.get_screenshot_as_png()
+                    self._io_pool.submit(screenshot_path.write_bytes, png_bytes)
+                    self.logger.info(f"Screenshot saved as '{screenshot_path}'")
+
+                raw_rows = self._extract_table()
+
+                # All rows come from the same page load, so they share one
+                # scrape timestamp instead of a clock read per row
+                scrape_ts = _fast_iso_now()
 
                 listings = []
-                rows = self.driver.find_elements(By.CSS_SELECTOR, "tbody tr")
-
-                for row in rows:
+                for cells in raw_rows:
+                    # Rows are plain strings extracted in one script call, so
+                    # the only parse failures are shape problems; %s-style
+                    # logging defers string building until a record is emitted
                     try:
-                        price_element = row.find_element(By.CSS_SELECTOR, "td:nth-child(2)")
-                        price_text = price_element.text.strip()
+                        if len(cells) < 5:
+                            continue
 
-                        cleaned_price = self._clean_price(price_text)
+                        cleaned_price = self._clean_price(cells[1].strip())
                         if cleaned_price is not None:
                             listing_data = {
                                 'price': cleaned_price,
-                                'timestamp': datetime.now().isoformat(),
-                                **self._extract_additional_info(row)
+                                'timestamp': scrape_ts,
+                                'available_amount': cells[2].strip(),
+                                'payment_methods': cells[3].strip(),
+                                'merchant_name': cells[4].strip()
                             }
                             listings.append(listing_data)
-                    except (NoSuchElementException, Exception) as e:
-                        self.logger.warning(f"Error parsing row: {str(e)}")
+                    except (AttributeError, IndexError, TypeError) as e:
+                        self.logger.warning("Error parsing row: %s", e)
                         continue
 
-                valid_listings = [l for l in listings if l['price'] is not None]
-                valid_listings.sort(key=lambda x: x['price'])
+                # The parse loop already skips rows without a price, so no
+                # second filtering pass is needed
+                listings.sort(key=operator.itemgetter('price'))
 
-                return {
+                result = {
                     "success": True,
-                    "BYBIT": valid_listings,
+                    "BYBIT": listings,
                     "metadata": {
                         "token": token,
                         "fiat": fiat,
                         "action_type": "buy" if action_type == "1" else "sell",
-                        "timestamp": datetime.now().isoformat(),
-                        "total_rows_found": len(rows),
-                        "valid_listings_found": len(valid_listings)
+                        "timestamp": _fast_iso_now(),
+                        "total_rows_found": len(raw_rows),
+                        "valid_listings_found": len(listings)
                     }
                 }
+                self._cache[cache_key] = (time.monotonic(), result)
+                return result
 
             except TimeoutException:
                 self.logger.error(f"Timeout waiting for content on attempt {attempt + 1}")
+                # Failures are where a screenshot actually aids debugging,
+                # so capture one regardless of the debug flag
+                try:
+                    failure_path = _timestamped_path(self.screenshots_dir, "bybit_timeout", f"_attempt{attempt + 1}.png")
+                    png_bytes = self.driver.get_screenshot_as_png()
+                    self._io_pool.submit(failure_path.write_bytes, png_bytes)
+                    self.logger.info(f"Failure screenshot saved as '{failure_path}'")
+                except Exception as e:
+                    self.logger.warning(f"Could not save failure screenshot: {str(e)}")
                 if attempt == max_retries - 1:
                     return {
                         "success": False,
                         "data": None,
                         "message": "Timeout error: Page failed to load after multiple attempts"
                     }
-                time.sleep(5)
+                # Exponential backoff with jitter: recover quickly when the
+                # next attempt would work, back off when the page is struggling
+                time.sleep(min(30.0, 0.5 * (2 ** attempt)) + random.uniform(0, 0.3))
 
             except Exception as e:
                 self.logger.error(f"Unexpected error: {str(e)}")
@@ -188,53 +450,283 @@ class BybitScraper:
                 }
 
     def close(self):
-        """Clean up resources."""
+        """Return the driver to the shared pool for reuse by later instances."""
         if self.driver:
-            self.driver.quit()
-            self.logger.info("Browser session closed")
+            try:
+                # Reset browser state before handing the session back
+                self.driver.delete_all_cookies()
+                self.driver.get('about:blank')
+                self._driver_pool.put(self.driver)
+                self.logger.info("Browser session returned to pool")
+            except Exception:
+                self._quit_driver(self.driver)
+                self.logger.info("Browser session closed")
+            self.driver = None
+
+        # Make sure any in-flight screenshot writes land before returning
+        self._io_pool.shutdown(wait=True)
+        # The log listener is shared by every instance, so it keeps running
+        # here and is stopped once at interpreter exit
+
+def _drain_driver_pool():
+    """Quit any pooled Chrome drivers (and their profiles) at process exit."""
+    while True:
+        try:
+            BybitScraper._quit_driver(BybitScraper._driver_pool.get_nowait())
+        except queue.Empty:
+            break
+        except Exception:
+            continue
+
+
+atexit.register(_drain_driver_pool)
+
 
-#binance data 
+def _scrape_one(job: Dict) -> Dict:
+    """Worker for scrape_many: run a single scrape in its own process."""
+    scraper = BybitScraper(headless=True)
+    try:
+        return scraper.get_p2p_listings(**job)
+    finally:
+        scraper.close()
+
+
+def scrape_many(jobs: List[Dict], max_workers: int = 4) -> List[Dict]:
+    """
+    Scrape several (token, fiat, action_type) combinations in parallel.
+
+    Selenium drivers are not thread-safe, so jobs are fanned out over
+    separate processes, each worker holding its own pooled driver. Uses the
+    'spawn' start method to avoid fork issues with a running Chrome.
+
+    Args:
+        jobs (List[Dict]): Keyword arguments for get_p2p_listings per job
+        max_workers (int): Number of worker processes
+
+    Returns:
+        List[Dict]: One result dict per job, in input order
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as executor:
+        return list(executor.map(_scrape_one, jobs))
+
+
+class BybitP2PAPI:
+    """Bybit P2P API client that hits the JSON endpoint behind the P2P page.
+
+    Returns the same format as BybitScraper so callers can swap between the
+    two; the Selenium scraper is kept as a fallback for when the API is
+    blocked (e.g. by Cloudflare).
+    """
+
+    BASE_URL = "https://api2.bybit.com/fiat/otc/item/online"
+
+    # Successful results are served from memory for this many seconds so
+    # tight polling loops don't re-hit the API for identical queries
+    _cache_ttl = 30
+
+    def __init__(self):
+        """Initialize the Bybit P2P API client with minimal setup."""
+        self._setup_logging()
+        self._setup_session()
+        self._cache: Dict[tuple, tuple] = {}
+
+    def _setup_logging(self) -> None:
+        """Configure basic logging."""
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+        self.logger = _configure_logger('BybitP2PAPI', handler)
+
+    def _setup_session(self) -> None:
+        """Configure requests session with retries and headers."""
+        self.session = requests.Session()
+
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # urllib3's default allowed methods exclude POST, and POST is
+            # the only request this client makes
+            allowed_methods=["POST"]
+        )
+
+        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.session.headers.update({
+            'Accept': '*/*',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Content-Type': 'application/json',
+            'Origin': 'https://www.bybit.com',
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+
+    def get_p2p_listings(
+        self,
+        token: str = "USDT",
+        fiat: str = "NGN",
+        action_type: str = "1",  # "1" for buy, "0" for sell
+        max_retries: int = 3,
+        rows: int = 20
+    ) -> Dict[str, Union[bool, List[Dict], str]]:
+        """
+        Get P2P listings from Bybit's JSON API.
+        Matches BybitScraper's return format.
+        """
+        cache_key = (token, fiat, action_type, rows)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            self.logger.info(f"Returning cached listings for {token}/{fiat}")
+            return cached[1]
+
+        payload = {
+            "userId": "",
+            "tokenId": token,
+            "currencyId": fiat,
+            "payment": [],
+            "side": action_type,
+            "size": str(rows),
+            "page": "1",
+            "amount": "",
+            "authMaturity": False,
+            "itemRegion": 1
+        }
+
+        self.logger.info(f"Fetching Bybit listings for {token}/{fiat}")
+
+        try:
+            response = self.session.post(self.BASE_URL, json=payload)
+            response.raise_for_status()
+
+            data = _decode_json_response(response)
+            items = data.get("result", {}).get("items")
+            if items is None:
+                raise ValueError("Invalid response format from Bybit API")
+
+            # One shared timestamp per response; the items all describe the
+            # same snapshot of the order book
+            scrape_ts = _fast_iso_now()
+
+            listings = []
+            for item in items:
+                listing_data = {
+                    'price': float(item["price"]),
+                    'timestamp': scrape_ts,
+                    'available_amount': item.get("lastQuantity", ""),
+                    'payment_methods': ", ".join(str(p) for p in item.get("payments", [])),
+                    'merchant_name': item.get("nickName", "Unknown")
+                }
+                listings.append(listing_data)
+
+            # No sort: the API returns items already price-ordered for the
+            # requested side
+
+            result = {
+                "success": True,
+                "BYBIT": listings,
+                "metadata": {
+                    "token": token,
+                    "fiat": fiat,
+                    "action_type": "buy" if action_type == "1" else "sell",
+                    "timestamp": _fast_iso_now(),
+                    "total_rows_found": len(items),
+                    "valid_listings_found": len(listings)
+                }
+            }
+            self._cache[cache_key] = (time.monotonic(), result)
+            return result
+
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Request failed: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "data": None,
+                "message": error_msg
+            }
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "data": None,
+                "message": error_msg
+            }
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self.session.close()
+
+#binance data
 class BinanceP2PAPI:
     """Simplified Binance P2P API client that matches BybitScraper's return format."""
     
     BASE_URL = "https://p2p.binance.com/bapi/c2c/v2/friendly/c2c/adv/search"
-    
+
+    # Successful results are served from memory for this many seconds so
+    # tight polling loops don't re-hit the API for identical queries
+    _cache_ttl = 30
+
+    # One session shared by every instance so the TCP+TLS connection to
+    # Binance is reused across repeated client construction
+    _shared_session: Optional[requests.Session] = None
+
     def __init__(self):
         """Initialize the Binance P2P API client with minimal setup."""
         self._setup_logging()
         self._setup_session()
+        self._cache: Dict[tuple, tuple] = {}
         
     def _setup_logging(self) -> None:
         """Configure basic logging."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler()]
-        )
-        self.logger = logging.getLogger('BinanceP2PAPI')
-        
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+        self.logger = _configure_logger('BinanceP2PAPI', handler)
+
     def _setup_session(self) -> None:
         """Configure requests session with retries and headers."""
+        if BinanceP2PAPI._shared_session is not None:
+            self.session = BinanceP2PAPI._shared_session
+            return
+
         self.session = requests.Session()
-        
+
         retry_strategy = Retry(
             total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"]
+        )
+
+        # Pool sized for parallel multi-pair polling; the default adapter
+        # caps out at 10 connections
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=retry_strategy
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
-        
+
         self.session.headers.update({
             'Accept': '*/*',
+            # Compressed responses cut the listing payload severalfold on
+            # the wire; urllib3 decompresses transparently
+            'Accept-Encoding': 'gzip, deflate, br',
             'Accept-Language': 'en-US,en;q=0.9',
             'Content-Type': 'application/json',
             'Origin': 'https://p2p.binance.com',
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
+        BinanceP2PAPI._shared_session = self.session
+
     def get_p2p_listings(
         self,
         token: str = "USDT",
@@ -247,6 +739,12 @@ class BinanceP2PAPI:
         Get P2P listings from Binance API.
         Matches BybitScraper's return format.
         """
+        cache_key = (token, fiat, action_type, rows)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            self.logger.info(f"Returning cached listings for {token}/{fiat}")
+            return cached[1]
+
         trade_type = "BUY" if action_type == "1" else "SELL"
         
         payload = {
@@ -266,28 +764,35 @@ class BinanceP2PAPI:
             response = self.session.post(self.BASE_URL, json=payload)
             response.raise_for_status()
             
-            data = response.json()
+            data = _decode_json_response(response)
             if not isinstance(data, dict) or "data" not in data:
                 raise ValueError("Invalid response format from Binance API")
             
+            # One shared timestamp per response; the ads all describe the
+            # same snapshot of the order book
+            scrape_ts = _fast_iso_now()
+
             listings = []
             for ad in data["data"]:
                 listing_data = {
                     'price': float(ad["adv"]["price"]),
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': scrape_ts,
                     'available_amount': ad["adv"]["surplusAmount"],
                     'payment_methods': ", ".join(method["identifier"] for method in ad["adv"]["tradeMethods"]),
                     'merchant_name': ad["advertiser"].get("nickName", "Unknown")
                 }
                 listings.append(listing_data)
             
-            # Sort listings by price like BybitScraper does
-            listings.sort(key=lambda x: x['price'])
-            
-            return {
+            # Defensive sort kept since downstream assumes price order;
+            # itemgetter avoids a Python-level call per comparison
+            listings.sort(key=operator.itemgetter('price'))
+
+            result = {
                 "success": True,
                 "BINANCE": listings,
             }
+            self._cache[cache_key] = (time.monotonic(), result)
+            return result
             
         except requests.exceptions.RequestException as e:
             error_msg = f"Request failed: {str(e)}"
@@ -306,40 +811,190 @@ class BinanceP2PAPI:
                 "message": error_msg
             }
 
+    def get_p2p_listings_many(self, pairs: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """
+        Fetch several (token, fiat, action_type) pairs concurrently.
+
+        The work is pure network I/O, so a small thread pool collapses wall
+        time from the sum of the request latencies to roughly the slowest
+        one; requests.Session is thread-safe for concurrent posts sharing
+        one adapter pool.
+
+        Args:
+            pairs (List[Dict]): Keyword arguments for get_p2p_listings per query
+            max_workers (int): Upper bound on concurrent requests
+
+        Returns:
+            List[Dict]: One result dict per pair, in input order
+        """
+        if not pairs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(lambda pair: self.get_p2p_listings(**pair), pairs))
+
+class BinanceP2PAsyncAPI:
+    """Async Binance P2P client for fanning many pair queries out at once.
+
+    Concurrent requests multiplex over a single HTTP/2 connection instead
+    of queueing behind one HTTP/1.1 round-trip each. Individual results
+    match BinanceP2PAPI's return format.
+    """
+
+    BASE_URL = BinanceP2PAPI.BASE_URL
+
+    _default_headers = {
+        'Accept': '*/*',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Content-Type': 'application/json',
+        'Origin': 'https://p2p.binance.com',
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+
+    def __init__(self):
+        """Initialize the async Binance P2P API client."""
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+        self.logger = _configure_logger('BinanceP2PAsyncAPI', handler)
+
+    async def _get_p2p_listings(
+        self,
+        client: httpx.AsyncClient,
+        token: str = "USDT",
+        fiat: str = "XAF",
+        action_type: str = "1",
+        rows: int = 6
+    ) -> Dict:
+        """Fetch one pair's listings on the shared client."""
+        trade_type = "BUY" if action_type == "1" else "SELL"
+
+        payload = {
+            "asset": token,
+            "fiat": fiat,
+            "merchantCheck": True,
+            "page": 1,
+            "payTypes": [],
+            "publisherType": None,
+            "rows": rows,
+            "tradeType": trade_type
+        }
+
+        try:
+            response = await client.post(self.BASE_URL, json=payload)
+            response.raise_for_status()
+
+            data = _decode_json_response(response)
+            if not isinstance(data, dict) or "data" not in data:
+                raise ValueError("Invalid response format from Binance API")
+
+            scrape_ts = _fast_iso_now()
+
+            listings = [{
+                'price': float(ad["adv"]["price"]),
+                'timestamp': scrape_ts,
+                'available_amount': ad["adv"]["surplusAmount"],
+                'payment_methods': ", ".join(method["identifier"] for method in ad["adv"]["tradeMethods"]),
+                'merchant_name': ad["advertiser"].get("nickName", "Unknown")
+            } for ad in data["data"]]
+
+            listings.sort(key=operator.itemgetter('price'))
+
+            return {
+                "success": True,
+                "BINANCE": listings,
+            }
+
+        except Exception as e:
+            error_msg = f"Request failed for {token}/{fiat}: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "data": None,
+                "message": error_msg
+            }
+
+    async def fetch_all(self, pairs: List[Dict]) -> List[Dict]:
+        """
+        Fetch several (token, fiat, action_type) pairs concurrently.
+
+        Args:
+            pairs (List[Dict]): Keyword arguments for each query
+
+        Returns:
+            List[Dict]: One result dict per pair, in input order
+        """
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=limits,
+            headers=self._default_headers
+        ) as client:
+            return list(await asyncio.gather(
+                *(self._get_p2p_listings(client, **pair) for pair in pairs)
+            ))
+
+    def fetch_all_sync(self, pairs: List[Dict]) -> List[Dict]:
+        """Blocking convenience wrapper around fetch_all."""
+        return asyncio.run(self.fetch_all(pairs))
+
+
+# Shared session for xe.com lookups: keeps the TCP+TLS connection alive
+# between calls instead of a fresh handshake per rate fetch
+_xe_session = requests.Session()
+_xe_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+
 def get_exchange_rate(from_currency='EUR', to_currency='XAF'):
+    # FX rates move slowly; memoize per 10-minute bucket so scheduler loops
+    # polling every minute pay for the fetch and parse once per bucket.
+    # The error handling lives out here: lru_cache does not memoize calls
+    # that raise, so a transient failure is retried on the next call
+    # instead of pinning None for the whole bucket
     try:
-        url = f'https://www.xe.com/currencyconverter/convert/?Amount=1&From={from_currency}&To={to_currency}'
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Target the specific paragraph with the rate
-        rate_element = soup.select_one('p.sc-63d8b7e3-1.bMdPIi')
-        
-        if rate_element:
-            # Extract the whole number part
-            whole_number = rate_element.contents[0].strip()
-            
-            # Extract the decimal part from the span
-            decimal_span = rate_element.find('span', class_='faded-digits')
-            decimal_part = decimal_span.text.strip() if decimal_span else ''
-            
-            # Combine and return full rate
-            full_rate = f"{whole_number}{decimal_part}"
-            return full_rate
-        
-        print("No rate found")
-        return None
-    
+        return _get_rate_cached(from_currency, to_currency, int(time.time() / 600))
     except Exception as e:
         print(f"Error: {e}")
         return None
 
+
+@functools.lru_cache(maxsize=8)
+def _get_rate_cached(from_currency, to_currency, minute_bucket):
+    """Fetch and parse the rate; raises on failure so only successes cache."""
+    from bs4 import BeautifulSoup
+
+    url = f'https://www.xe.com/currencyconverter/convert/?Amount=1&From={from_currency}&To={to_currency}'
+
+    response = _xe_session.get(url)
+    # lxml parses the page several times faster than the pure-Python
+    # html.parser; fall back if it is not installed
+    try:
+        soup = BeautifulSoup(response.text, 'lxml')
+    except Exception:
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+    # Target the specific paragraph with the rate
+    rate_element = soup.select_one('p.sc-63d8b7e3-1.bMdPIi')
+
+    if rate_element is None:
+        raise ValueError("No rate found")
+
+    # Extract the whole number part
+    whole_number = rate_element.contents[0].strip()
+
+    # Extract the decimal part from the span
+    decimal_span = rate_element.find('span', class_='faded-digits')
+    decimal_part = decimal_span.text.strip() if decimal_span else ''
+
+    # Combine and return full rate
+    return f"{whole_number}{decimal_part}"
+
 import sqlite3
+import csv
 import logging
 from datetime import datetime
 from typing import Dict, List, Union, Optional
@@ -370,27 +1025,36 @@ class DataSaver:
 
     def _setup_directories(self) -> None:
         """Create necessary directories for storing data."""
-        # Create base directory if it doesn't exist
-        self.base_dir.mkdir(exist_ok=True)
-        
-        # Create subdirectories for different data types
-        self.logs_dir = self.base_dir / 'logs'
-        self.logs_dir.mkdir(exist_ok=True)
+        dirs = _ensure_dirs(str(self.base_dir))
+        self.base_dir = dirs['base']
+        self.logs_dir = dirs['logs']
 
     def _setup_logging(self) -> None:
         """Set up logging configuration."""
-        log_file = self.logs_dir / f'data_saver_{datetime.now().strftime("%Y%m%d")}.log'
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        log_file = self.logs_dir / f'data_saver_{datetime.now():%Y%m%d}.log'
+
+        if not logging.getLogger('DataSaver').handlers:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            # Buffer records in memory and flush to a size-capped rotating
+            # file in batches, so logging does one disk write per 128 records
+            # instead of one per record; errors flush immediately
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=10_000_000, backupCount=5, encoding='utf-8', delay=True
+            )
+            file_handler.setFormatter(formatter)
+            buffered_handler = MemoryHandler(
+                capacity=128, flushLevel=logging.ERROR, target=file_handler
+            )
+            atexit.register(buffered_handler.flush)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            _configure_logger('DataSaver', buffered_handler, stream_handler)
+
+        self.logger = logging.getLogger('DataSaver')
         self.logger.info(f"DataSaver logging initialized. Log file: {log_file}")
 
     def _create_connection(self) -> None:
@@ -398,6 +1062,12 @@ class DataSaver:
         try:
             self.conn = sqlite3.connect(self.db_path)
             self.cursor = self.conn.cursor()
+            # WAL lets readers run concurrently with the writer and turns
+            # commits into sequential log appends; synchronous=NORMAL skips
+            # the per-commit fsync that dominates small transactions
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
             self.logger.info(f"Connected to SQLite database: {self.db_path}")
         except sqlite3.Error as e:
             self.logger.error(f"Error connecting to SQLite database: {e}")
@@ -484,72 +1154,49 @@ class DataSaver:
         try:
             # Start a transaction
             self.conn.execute('BEGIN TRANSACTION')
-    
+
             new_listings_count = {
                 'bybit': 0,
                 'binance': 0
             }
-    
-            # Save Bybit listings
-            if bybit_data and bybit_data.get("success") and bybit_data.get("BYBIT"):
-                for listing in bybit_data["BYBIT"]:
-                    # Check for existing listing to prevent duplicates
-                    self.cursor.execute('''
-                        SELECT id FROM bybit_listings 
-                        WHERE price = ? 
-                        AND timestamp = ? 
-                        AND merchant_name = ?
-                    ''', (
+
+            # One executemany per table with the duplicate check folded into
+            # the INSERT itself, instead of a SELECT + INSERT round-trip per
+            # listing; total_changes reveals how many rows actually landed
+            insert_sql_template = '''
+                INSERT INTO {table}
+                (price, timestamp, available_amount, payment_methods, merchant_name)
+                SELECT ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {table}
+                    WHERE price = ? AND timestamp = ? AND merchant_name = ?
+                )
+            '''
+
+            for key, table, payload in (
+                ('bybit', 'bybit_listings', bybit_data),
+                ('binance', 'binance_listings', binance_data)
+            ):
+                if not (payload and payload.get("success") and payload.get(key.upper())):
+                    continue
+
+                rows = [
+                    (
                         listing.get('price'),
                         listing.get('timestamp'),
-                        listing.get('merchant_name')
-                    ))
-                    
-                    # Only insert if no duplicate exists
-                    if not self.cursor.fetchone():
-                        self.cursor.execute('''
-                            INSERT INTO bybit_listings 
-                            (price, timestamp, available_amount, payment_methods, merchant_name) 
-                            VALUES (?, ?, ?, ?, ?)
-                        ''', (
-                            listing.get('price'),
-                            listing.get('timestamp'),
-                            listing.get('available_amount'),
-                            listing.get('payment_methods'),
-                            listing.get('merchant_name')
-                        ))
-                        new_listings_count['bybit'] += 1
-    
-            # Save Binance listings
-            if binance_data and binance_data.get("success") and binance_data.get("BINANCE"):
-                for listing in binance_data["BINANCE"]:
-                    # Check for existing listing to prevent duplicates
-                    self.cursor.execute('''
-                        SELECT id FROM binance_listings 
-                        WHERE price = ? 
-                        AND timestamp = ? 
-                        AND merchant_name = ?
-                    ''', (
+                        listing.get('available_amount'),
+                        listing.get('payment_methods'),
+                        listing.get('merchant_name'),
                         listing.get('price'),
                         listing.get('timestamp'),
                         listing.get('merchant_name')
-                    ))
-                    
-                    # Only insert if no duplicate exists
-                    if not self.cursor.fetchone():
-                        self.cursor.execute('''
-                            INSERT INTO binance_listings 
-                            (price, timestamp, available_amount, payment_methods, merchant_name) 
-                            VALUES (?, ?, ?, ?, ?)
-                        ''', (
-                            listing.get('price'),
-                            listing.get('timestamp'),
-                            listing.get('available_amount'),
-                            listing.get('payment_methods'),
-                            listing.get('merchant_name')
-                        ))
-                        new_listings_count['binance'] += 1
-    
+                    )
+                    for listing in payload[key.upper()]
+                ]
+                before = self.conn.total_changes
+                self.cursor.executemany(insert_sql_template.format(table=table), rows)
+                new_listings_count[key] = self.conn.total_changes - before
+
             # Save exchange rate if provided
             if exchange_rate is not None:
                 self.cursor.execute('''
@@ -560,7 +1207,7 @@ class DataSaver:
                     from_currency,
                     to_currency,
                     exchange_rate,
-                    datetime.now().isoformat()
+                    _fast_iso_now()
                 ))
     
             # Save metadata
@@ -574,7 +1221,7 @@ class DataSaver:
                 bybit_data.get('metadata', {}).get('action_type', ''),
                 new_listings_count['bybit'],
                 new_listings_count['binance'],
-                datetime.now().isoformat()
+                _fast_iso_now()
             ))
     
             # Commit the transaction
@@ -686,6 +1333,53 @@ class DataSaver:
             self.logger.error(f"Error retrieving exchange rates: {e}")
             return []
 
+    def export_listings_csv(
+        self,
+        source: str = 'bybit',
+        limit: int = 1000,
+        output_path: Optional[Union[str, Path]] = None
+    ) -> Optional[Path]:
+        """
+        Export listings to a CSV file.
+
+        Uses csv.DictWriter directly so rows stream straight to disk without
+        going through a spreadsheet writer, which is far faster for plain
+        tabular data.
+
+        Args:
+            source (str): Source of listings ('bybit' or 'binance')
+            limit (int): Maximum number of listings to export
+            output_path (Optional[Union[str, Path]]): Destination file; defaults
+                to a timestamped file in the base directory
+
+        Returns:
+            Optional[Path]: Path of the written file, or None if nothing was written
+        """
+        try:
+            listings = self.retrieve_last_listings(source=source, limit=limit)
+            if not listings:
+                self.logger.warning(f"No {source} listings to export")
+                return None
+
+            if output_path is None:
+                output_path = _timestamped_path(self.base_dir, f"{source}_listings", ".csv")
+            output_path = Path(output_path)
+
+            # 1MB buffer coalesces DictWriter's many small writes into a
+            # handful of syscalls instead of one per ~8KB
+            with open(output_path, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=list(listings[0].keys()))
+                writer.writeheader()
+                writer.writerows(listings)
+
+            self.logger.info(f"Exported {len(listings)} {source} listings to {output_path}")
+            return output_path
+
+        except (OSError, csv.Error) as e:
+            self.logger.error(f"Error exporting listings to CSV: {e}")
+            return None
+
     def close(self) -> None:
         """Close database connection."""
         try:
@@ -695,20 +1389,24 @@ class DataSaver:
         except Exception as e:
             self.logger.error(f"Error closing database connection: {e}")
 
-import pandas as pd
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
 class P2PDataProcessor:
     @staticmethod
-    def process_listings_data(listings_data: List[Dict[str, Any]]) -> pd.DataFrame:
+    def process_listings_data(listings_data: List[Dict[str, Any]]) -> "pd.DataFrame":
         """Process raw listings data into a cleaned DataFrame with consistent timestamps."""
+        import pandas as pd
+
         if not listings_data:
             return pd.DataFrame()
-            
+
         df = pd.DataFrame(listings_data)
         df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
+        # P2P prices carry at most ~6 significant digits, so float32 is
+        # lossless here and halves the column's memory
+        df['price'] = df['price'].astype('float32')
+
         # Round timestamp to minutes for grouping
         df['timestamp_rounded'] = df['timestamp'].dt.floor('min')
         
@@ -817,10 +1515,13 @@ if __name__ == "__main__":
 
 class P2PGraphGenerator:
     def __init__(self):
+        import matplotlib.pyplot as plt
         plt.style.use('classic')
-        
-    def process_data(self, listings_data: List[Dict[str, Any]]) -> pd.DataFrame:
+
+    def process_data(self, listings_data: List[Dict[str, Any]]) -> "pd.DataFrame":
         """Convert listings data to DataFrame and process timestamps."""
+        import pandas as pd
+
         df = pd.DataFrame(listings_data)
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         return df.sort_values('timestamp')
@@ -831,6 +1532,8 @@ class P2PGraphGenerator:
                             save_path: Optional[str] = None,
                             figure_size: tuple = (12, 6)):
         """Create a single graph showing both exchanges' data."""
+        import matplotlib.pyplot as plt
+
         try:
             plt.figure(figsize=figure_size)
             
@@ -879,6 +1582,8 @@ class P2PGraphGenerator:
                              save_path: Optional[str] = None,
                              figure_size: tuple = (12, 6)):
         """Create a separate graph for a single exchange."""
+        import matplotlib.pyplot as plt
+
         try:
             plt.figure(figsize=figure_size)
             
@@ -929,38 +1634,52 @@ def main():
     
     try:
         # Initialize components
-        scraper = BybitScraper(headless=True)
+        bybit = BybitP2PAPI()
         binance = BinanceP2PAPI()
         data_saver = DataSaver(base_directory='pb2b', db_filename='p2p_listings.db')
         processor = P2PDataProcessor()
 
-        # Fetch P2P listings with error handling
-        try:
-            bybit_listings = scraper.get_p2p_listings(
-                token="USDT",
-                fiat="NGN",
-                action_type="1"
+        # The three fetches are independent network I/O, so run them in
+        # parallel and pay max() instead of sum() of their latencies. Each
+        # client holds its own HTTP session, which is safe across threads.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            f_bybit = executor.submit(
+                bybit.get_p2p_listings,
+                token="USDT", fiat="NGN", action_type="1"
             )
-        except Exception as e:
-            print(f"Error fetching Bybit listings: {str(e)}")
-            bybit_listings = []
-
-        try:
-            binance_listings = binance.get_p2p_listings(
-                token="USDT",
-                fiat="EUR",
-                action_type="1"
+            f_binance = executor.submit(
+                binance.get_p2p_listings,
+                token="USDT", fiat="EUR", action_type="1"
             )
-        except Exception as e:
-            print(f"Error fetching Binance listings: {str(e)}")
-            binance_listings = []
+            f_rate = executor.submit(get_exchange_rate)
 
-        # Get exchange rate with error handling
-        try:
-            rate = float(get_exchange_rate())
-        except (TypeError, ValueError) as e:
-            print(f"Error getting exchange rate: {str(e)}")
-            rate = None
+            # Prefer the direct API and only fall back to the Selenium
+            # scraper if the API is blocked; the fallback stays sequential
+            # because WebDriver is not thread-safe
+            try:
+                bybit_listings = f_bybit.result()
+                if not bybit_listings.get("success"):
+                    scraper = BybitScraper(headless=True)
+                    bybit_listings = scraper.get_p2p_listings(
+                        token="USDT",
+                        fiat="NGN",
+                        action_type="1"
+                    )
+            except Exception as e:
+                print(f"Error fetching Bybit listings: {str(e)}")
+                bybit_listings = []
+
+            try:
+                binance_listings = f_binance.result()
+            except Exception as e:
+                print(f"Error fetching Binance listings: {str(e)}")
+                binance_listings = []
+
+            try:
+                rate = float(f_rate.result())
+            except (TypeError, ValueError) as e:
+                print(f"Error getting exchange rate: {str(e)}")
+                rate = None
 
         # Save data to SQLite
         try:
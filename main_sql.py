@@ -1,10 +1,69 @@
 import sqlite3
 import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from operator import itemgetter
 from datetime import datetime
 from typing import Dict, List, Union, Optional
 from pathlib import Path
 import json
 
+# Fixed SQL text hoisted to module scope: identical strings hit sqlite3's
+# prepared-statement cache on every call instead of being re-parsed
+_BYBIT_INSERT_SQL = '''
+    INSERT INTO bybit_listings
+    (price, timestamp, available_amount, payment_methods, merchant_name)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_BINANCE_INSERT_SQL = '''
+    INSERT INTO binance_listings
+    (price, timestamp, available_amount, payment_methods, merchant_name)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_RATE_INSERT_SQL = '''
+    INSERT INTO exchange_rates
+    (from_currency, to_currency, rate, timestamp)
+    VALUES (?, ?, ?, ?)
+'''
+
+_META_INSERT_SQL = '''
+    INSERT INTO metadata
+    (token, fiat, action_type, total_bybit_listings, total_binance_listings, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# C-level field extraction for the insert loops: one call per listing
+# instead of five dict.get calls. itemgetter raises KeyError on missing
+# keys, so listings are merged over a defaults dict first — save_data is
+# public and callers may pass partial dicts, which should insert NULLs
+# like the .get-based code did
+_LISTING_DEFAULTS = dict.fromkeys(
+    ('price', 'timestamp', 'available_amount', 'payment_methods', 'merchant_name')
+)
+_LISTING_FIELDS = itemgetter(*_LISTING_DEFAULTS)
+
+# Explicit column lists: no per-call cursor.description parsing, and the
+# statement keeps working if the tables ever grow extra columns
+_LISTING_COLS = 'id, price, timestamp, available_amount, payment_methods, merchant_name'
+_RATE_COLS = 'id, from_currency, to_currency, rate, timestamp'
+
+# Every legal retrieval statement, prebuilt: the fixed text acts as a
+# whitelist against identifier injection and always hits the statement
+# cache, instead of re-preparing a fresh f-string per sort column
+_RETRIEVE_SQL = {
+    (source, col, direction):
+        f'SELECT {_LISTING_COLS} FROM {table} ORDER BY {col} {direction} LIMIT ?'
+    for source, table in (('bybit', 'bybit_listings'),
+                          ('binance', 'binance_listings'))
+    for col in ('id', 'price', 'timestamp')
+    for direction in ('ASC', 'DESC')
+}
+
+
 class DataSaver:
     """A class responsible for saving and retrieving data using SQLite3."""
     
@@ -25,7 +84,18 @@ class DataSaver:
         
         # Create database connection and tables
         self._create_connection()
+        self._configure_pragmas()
         self._create_tables()
+        self._create_reader_pool()
+
+        # Writes are handed to a dedicated thread through a bounded queue,
+        # so callers never block on the commit fsync; the bound applies
+        # backpressure if the producer outruns the disk
+        self._write_queue: queue.Queue = queue.Queue(maxsize=32)
+        self._writer_thread = threading.Thread(
+            target=self._drain_writes, name='datasaver-writer', daemon=True
+        )
+        self._writer_thread.start()
 
     def _setup_directories(self) -> None:
         """Create necessary directories for storing data."""
@@ -55,20 +125,73 @@ class DataSaver:
     def _create_connection(self) -> None:
         """Create a connection to the SQLite database."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
+            # isolation_level=None turns off sqlite3's implicit BEGINs so
+            # the explicit BEGIN/COMMIT in save_data is the only
+            # transaction control in play
+            # check_same_thread=False lets the background writer thread use
+            # the connection opened here; it is the only thread that writes
+            self.conn = sqlite3.connect(
+                self.db_path, isolation_level=None, cached_statements=256,
+                check_same_thread=False
+            )
             self.logger.info(f"Connected to SQLite database: {self.db_path}")
         except sqlite3.Error as e:
             self.logger.error(f"Error connecting to SQLite database: {e}")
             raise
 
+    def _create_reader_pool(self) -> None:
+        """Open a small pool of read-only connections.
+
+        Under WAL, reads run concurrently with the writer, and each
+        connection keeps its own page cache, so retrieval no longer evicts
+        pages the writer just touched.
+        """
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(os.cpu_count() or 2):
+            reader = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, cached_statements=256
+            )
+            # Row supports dict(row) directly, replacing the per-call
+            # description parse and per-row zip
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA busy_timeout=5000")
+            self._readers.put(reader)
+
+    @contextmanager
+    def _acquire_reader(self):
+        """Check a read-only connection out of the pool and return it after."""
+        reader = self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
+    def _configure_pragmas(self) -> None:
+        """Tune the connection for write-heavy use.
+
+        WAL removes one fsync per commit and lets readers run alongside the
+        writer; synchronous=NORMAL is safe under WAL and skips the second
+        sync; the rest are the usual cache/temp/locking knobs.
+        """
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA busy_timeout=5000")
+            self.conn.execute("PRAGMA cache_size=-20000")
+            self.conn.execute("PRAGMA temp_store=memory")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            self.logger.info("Database pragmas configured (WAL mode)")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error configuring pragmas: {e}")
+            raise
+
     def _create_tables(self) -> None:
         """Create necessary tables if they don't exist."""
         try:
             # Create Bybit listings table
-            self.cursor.execute('''
+            self.conn.execute('''
                 CREATE TABLE IF NOT EXISTS bybit_listings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     price REAL,
                     timestamp TEXT,
                     available_amount TEXT,
@@ -78,9 +201,9 @@ class DataSaver:
             ''')
 
             # Create Binance listings table
-            self.cursor.execute('''
+            self.conn.execute('''
                 CREATE TABLE IF NOT EXISTS binance_listings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     price REAL,
                     timestamp TEXT,
                     available_amount TEXT,
@@ -90,9 +213,9 @@ class DataSaver:
             ''')
 
             # Create exchange rates table
-            self.cursor.execute('''
+            self.conn.execute('''
                 CREATE TABLE IF NOT EXISTS exchange_rates (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     from_currency TEXT,
                     to_currency TEXT,
                     rate REAL,
@@ -101,9 +224,9 @@ class DataSaver:
             ''')
 
             # Create metadata table for storing combined data metadata
-            self.cursor.execute('''
+            self.conn.execute('''
                 CREATE TABLE IF NOT EXISTS metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     token TEXT,
                     fiat TEXT,
                     action_type TEXT,
@@ -113,6 +236,28 @@ class DataSaver:
                 )
             ''')
 
+            # Indexes covering the retrieval patterns: ORDER BY price or
+            # timestamp with LIMIT walks the B-tree and stops after N rows
+            # instead of scanning and sorting the whole table
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_bybit_listings_price ON bybit_listings(price)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_bybit_listings_timestamp ON bybit_listings(timestamp)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_binance_listings_price ON binance_listings(price)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_binance_listings_timestamp ON binance_listings(timestamp)'
+            )
+            # Composite index matching retrieve_exchange_rates' WHERE on the
+            # currency pair plus its ORDER BY timestamp DESC
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_xrates_ft_ts '
+                'ON exchange_rates(from_currency, to_currency, timestamp DESC)'
+            )
+
             self.conn.commit()
             self.logger.info("Database tables created successfully")
         except sqlite3.Error as e:
@@ -138,67 +283,113 @@ class DataSaver:
             to_currency (str): Target currency for exchange rate
             
         Returns:
-            Dict[str, Union[bool, str]]: Result of save operation
+            Dict[str, Union[bool, str]]: Result of enqueueing the save;
+            call flush() to wait until it has actually been written
         """
+        self._write_queue.put(
+            (bybit_data, binance_data, exchange_rate, from_currency, to_currency)
+        )
+        return {
+            "success": True,
+            "message": "Save queued",
+            "database_path": str(self.db_path)
+        }
+
+    def flush(self) -> None:
+        """Block until every save queued so far has been written."""
+        self._write_queue.join()
+
+    def _drain_writes(self) -> None:
+        """Writer-thread loop: perform queued saves until the sentinel."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            try:
+                self._save_now(*item)
+            except Exception as e:
+                # The thread must survive any bad payload: log, make sure no
+                # BEGIN IMMEDIATE is left open, and move on to the next item
+                self.logger.error(f"Error in writer thread, save dropped: {e}")
+                try:
+                    if self.conn.in_transaction:
+                        self.conn.rollback()
+                except sqlite3.Error:
+                    pass
+            finally:
+                self._write_queue.task_done()
+
+    def _save_now(
+        self,
+        bybit_data: Dict[str, Union[bool, List[Dict], str]] = None,
+        binance_data: Dict[str, Union[bool, List[Dict], str]] = None,
+        exchange_rate: Optional[float] = None,
+        from_currency: str = 'EUR',
+        to_currency: str = 'XAF'
+    ) -> Dict[str, Union[bool, str]]:
+        """Perform one save synchronously on the writer connection."""
+        has_bybit = bool(bybit_data and bybit_data.get("success") and bybit_data.get("BYBIT"))
+        has_binance = bool(binance_data and binance_data.get("success") and binance_data.get("BINANCE"))
+        has_rate = exchange_rate is not None
+
+        # Nothing to persist: skip the transaction (and its fsync) entirely
+        if not (has_bybit or has_binance or has_rate):
+            self.logger.info("No data to save; skipping database write")
+            return {
+                "success": True,
+                "message": "No data to save",
+                "database_path": str(self.db_path)
+            }
+
         try:
-            # Start a transaction
-            self.conn.execute('BEGIN TRANSACTION')
-
-            # Save Bybit listings
-            if bybit_data and bybit_data.get("success") and bybit_data.get("BYBIT"):
-                for listing in bybit_data["BYBIT"]:
-                    self.cursor.execute('''
-                        INSERT INTO bybit_listings 
-                        (price, timestamp, available_amount, payment_methods, merchant_name) 
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        listing.get('price'),
-                        listing.get('timestamp'),
-                        listing.get('available_amount'),
-                        listing.get('payment_methods'),
-                        listing.get('merchant_name')
-                    ))
-
-            # Save Binance listings
-            if binance_data and binance_data.get("success") and binance_data.get("BINANCE"):
-                for listing in binance_data["BINANCE"]:
-                    self.cursor.execute('''
-                        INSERT INTO binance_listings 
-                        (price, timestamp, available_amount, payment_methods, merchant_name) 
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        listing.get('price'),
-                        listing.get('timestamp'),
-                        listing.get('available_amount'),
-                        listing.get('payment_methods'),
-                        listing.get('merchant_name')
-                    ))
+            # One timestamp per call: the rate and metadata rows belong to
+            # the same logical commit and should agree
+            now_iso = datetime.now().isoformat()
+
+            # Take the write lock upfront: a deferred BEGIN would upgrade
+            # on the first INSERT and can hit SQLITE_BUSY under WAL when
+            # readers are active
+            self.conn.execute('BEGIN IMMEDIATE')
+
+            # Save Bybit listings in one batched insert: executemany keeps
+            # the prepared statement and crosses into SQLite once per table
+            # instead of once per listing
+            if has_bybit:
+                self.conn.executemany(
+                    _BYBIT_INSERT_SQL,
+                    [_LISTING_FIELDS({**_LISTING_DEFAULTS, **listing})
+                     for listing in bybit_data["BYBIT"]]
+                )
+
+            # Save Binance listings the same way
+            if has_binance:
+                self.conn.executemany(
+                    _BINANCE_INSERT_SQL,
+                    [_LISTING_FIELDS({**_LISTING_DEFAULTS, **listing})
+                     for listing in binance_data["BINANCE"]]
+                )
 
             # Save exchange rate if provided
-            if exchange_rate is not None:
-                self.cursor.execute('''
-                    INSERT INTO exchange_rates 
-                    (from_currency, to_currency, rate, timestamp) 
-                    VALUES (?, ?, ?, ?)
-                ''', (
+            if has_rate:
+                self.conn.execute(_RATE_INSERT_SQL, (
                     from_currency,
                     to_currency,
                     exchange_rate,
-                    datetime.now().isoformat()
+                    now_iso
                 ))
 
-            # Save metadata
-            self.cursor.execute('''
-                INSERT INTO metadata 
-                (token, fiat, action_type, total_bybit_listings, total_binance_listings, timestamp) 
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                bybit_data.get('metadata', {}).get('token', ''),
-                bybit_data.get('metadata', {}).get('fiat', ''),
-                bybit_data.get('metadata', {}).get('action_type', ''),
-                len(bybit_data.get("BYBIT", [])),
-                len(binance_data.get("BINANCE", [])),
-                datetime.now().isoformat()
+            # Save metadata; locals computed once instead of rebuilding the
+            # empty-dict sentinel for every field and re-walking the lists
+            meta = (bybit_data or {}).get('metadata') or {}
+            bybit_count = len(bybit_data["BYBIT"]) if has_bybit else 0
+            binance_count = len(binance_data["BINANCE"]) if has_binance else 0
+            self.conn.execute(_META_INSERT_SQL, (
+                meta.get('token', ''),
+                meta.get('fiat', ''),
+                meta.get('action_type', ''),
+                bybit_count,
+                binance_count,
+                now_iso
             ))
 
             # Commit the transaction
@@ -240,21 +431,18 @@ class DataSaver:
         Returns:
             List[Dict]: Retrieved listings
         """
+        source_key = 'bybit' if source.lower() == 'bybit' else 'binance'
+        order_direction = 'ASC' if ascending else 'DESC'
+
         try:
-            table = 'bybit_listings' if source.lower() == 'bybit' else 'binance_listings'
-            order_direction = 'ASC' if ascending else 'DESC'
-            
-            query = f'''
-                SELECT * FROM {table} 
-                ORDER BY {order_by} {order_direction} 
-                LIMIT ?
-            '''
-            
-            self.cursor.execute(query, (limit,))
-            columns = [column[0] for column in self.cursor.description]
-            
-            return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
-        
+            query = _RETRIEVE_SQL[(source_key, order_by, order_direction)]
+        except KeyError:
+            raise ValueError(f"Unsupported order_by column: {order_by!r}")
+
+        try:
+            with self._acquire_reader() as reader:
+                return [dict(row) for row in reader.execute(query, (limit,))]
+
         except sqlite3.Error as e:
             self.logger.error(f"Error retrieving listings: {e}")
             return []
@@ -277,7 +465,7 @@ class DataSaver:
             List[Dict]: Retrieved exchange rates
         """
         try:
-            query = 'SELECT * FROM exchange_rates'
+            query = f'SELECT {_RATE_COLS} FROM exchange_rates'
             conditions = []
             params = []
             
@@ -294,22 +482,29 @@ class DataSaver:
             
             query += ' ORDER BY timestamp DESC LIMIT ?'
             params.append(limit)
-            
-            self.cursor.execute(query, params)
-            columns = [column[0] for column in self.cursor.description]
-            
-            return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
-        
+
+            with self._acquire_reader() as reader:
+                return [dict(row) for row in reader.execute(query, params)]
+
         except sqlite3.Error as e:
             self.logger.error(f"Error retrieving exchange rates: {e}")
             return []
 
     def close(self) -> None:
-        """Close database connection."""
+        """Flush pending writes, then close every connection."""
         try:
+            if hasattr(self, '_writer_thread') and self._writer_thread.is_alive():
+                self._write_queue.put(None)
+                self._writer_thread.join()
+            if hasattr(self, '_readers'):
+                while True:
+                    try:
+                        self._readers.get_nowait().close()
+                    except queue.Empty:
+                        break
             if hasattr(self, 'conn'):
                 self.conn.close()
-                self.logger.info("SQLite database connection closed")
+                self.logger.info("SQLite database connections closed")
         except Exception as e:
             self.logger.error(f"Error closing database connection: {e}")
 
@@ -353,6 +548,9 @@ def main():
         print(f"\nDatabase Save Result: {saved_result['success']}")
         print(f"Database Path: {saved_result['database_path']}")
 
+        # Wait for the queued save to land before reading it back
+        data_saver.flush()
+
         # Demonstrate data retrieval
         print("\nRetrieving Bybit Listings:")
         bybit_listings = data_saver.retrieve_listings(source='bybit', limit=5)